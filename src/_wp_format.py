@@ -0,0 +1,72 @@
+"""
+Formatting of raw WordPress API items into ContentItem rows.
+
+This module is the per-item hot path of every search and has no I/O, so it
+is kept fully typed and free of dynamic tricks that mypyc cannot compile.
+It runs as plain Python by default; building it with ``mypyc`` (see the
+README) produces an extension module that Python imports in its place.
+"""
+
+import sys
+from typing import Any, Dict, List, NamedTuple, Optional
+
+
+class ContentItem(NamedTuple):
+    """
+    Single WordPress content item.
+    
+    A tuple subclass, so each item is a fixed-size row without a
+    per-instance dict.
+    """
+    id: Optional[int]
+    title: str
+    excerpt: str
+    content: str
+    url: str
+    date: str
+    author: str
+    type: str
+    slug: str
+
+
+def format_content_item(item: Dict[str, Any]) -> ContentItem:
+    """
+    Format a WordPress content item for consistent output.
+    
+    Author names and post types repeat across items, so they are interned
+    to share one string per value in cached results.
+    
+    Args:
+        item: Raw content item from WordPress API
+    
+    Returns:
+        Formatted content item
+    """
+    # Handle the actual API response format
+    author_info = item.get('author')
+    author_name = author_info.get('name') if isinstance(author_info, dict) else None
+    
+    return ContentItem(
+        item.get('id'),
+        item.get('title', 'Untitled'),
+        item.get('excerpt', ''),
+        item.get('content', ''),
+        item.get('url', ''),
+        item.get('date', ''),
+        sys.intern(author_name or 'Unknown'),
+        sys.intern(item.get('type') or 'post'),
+        item.get('slug', '')
+    )
+
+
+def format_content_items(content: List[Dict[str, Any]]) -> List[ContentItem]:
+    """
+    Format a page of raw WordPress content items.
+    
+    Args:
+        content: Raw content items from WordPress API
+    
+    Returns:
+        Formatted content items in the same order
+    """
+    return list(map(format_content_item, content))
@@ -2,35 +2,165 @@
 AI-powered search engine using OpenRouter and tool calling.
 """
 
-import json
-import requests
-from typing import List, Dict, Any, Optional, Callable
+import functools
+import itertools
+import queue
+import threading
+import time
+import httpx
+import orjson
+from pydantic import ValidationError
+from concurrent.futures import Future, ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import List, Dict, Any, Optional, Callable, Tuple
 from .config import config
-from .wordpress_client import WordPressClient, WordPressAPIError
+from .model_router import ModelRouter
+from .schemas import ChatCompletionChunk, ChatResponse, Choice, Message, ToolCall
+from .wordpress_client import WordPressAPIError, WordPressResults, get_client
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+
+# Token budget for the search results sent to the model, leaving room for
+# the prompt and the answer within small context windows
+RESULTS_TOKEN_BUDGET = 6000
+
+# Tokens of each excerpt included in the search results
+EXCERPT_TOKEN_LIMIT = 50
+
+# Rough characters-per-token ratio used when tiktoken is unavailable
+CHARS_PER_TOKEN = 4
+
+
+# System prompts are kept byte-for-byte stable across requests so providers
+# can serve them from their prompt cache.
+_SEARCH_SYSTEM_PROMPT = """You are a helpful AI assistant that searches WordPress content intelligently.
+
+When a user asks a question:
+1. Use the search_wordpress tool to retrieve content
+2. Analyze ALL returned content for relevance, even if it doesn't contain exact keywords
+3. Look for semantic relationships, related concepts, and contextual relevance
+4. Consider synonyms, related terms, and broader topics
+5. If content is tangentially related or could be helpful, include it
+6. Always provide accurate citations and source links
+
+Once the search results are returned, answer the question clearly and concisely based on them.
+
+Be flexible in your search - don't require exact keyword matches. Think about what the user is really looking for."""
+
+_BATCH_SYSTEM_PROMPT = """You are a helpful assistant that analyzes search results intelligently.
+
+You will be given several numbered user queries, each followed by its own search results.
+Answer every query using only its own search results, considering semantic relevance and
+not just exact keyword matches.
+
+Respond with only a JSON array containing one object per query:
+[{"index": 1, "analysis": "answer in markdown", "citations": ["source url", ...]}, ...]"""
+
+
+@functools.lru_cache(maxsize=1)
+def _get_encoding():
+    """Load the tokenizer once, or return None if it is unavailable."""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        # The encoding file is downloaded on first use and may be unreachable
+        return None
+
+
+def _count_tokens(text: str) -> int:
+    """Count the tokens in text, estimating when tiktoken is unavailable."""
+    encoding = _get_encoding()
+    if encoding is None:
+        return len(text) // CHARS_PER_TOKEN + 1
+    return len(encoding.encode(text))
+
+
+def _truncate_tokens(text: str, limit: int) -> str:
+    """Truncate text to at most limit tokens."""
+    encoding = _get_encoding()
+    if encoding is None:
+        return text[:limit * CHARS_PER_TOKEN]
+    tokens = encoding.encode(text)
+    if len(tokens) <= limit:
+        return text
+    return encoding.decode(tokens[:limit])
+
+
+class _Cancellation:
+    """
+    Cancels a group of in-flight streaming requests.
+    
+    Open responses are tracked so cancelling closes them and releases
+    their connections immediately instead of waiting for them to finish.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._responses: set = set()
+        self.cancelled = False
+    
+    def check(self):
+        """Raise if the group has been cancelled."""
+        if self.cancelled:
+            raise AIError("Request cancelled")
+    
+    def register(self, response: httpx.Response):
+        """Track an open response, closing it at once if already cancelled."""
+        with self._lock:
+            if not self.cancelled:
+                self._responses.add(response)
+                return
+        response.close()
+        raise AIError("Request cancelled")
+    
+    def cancel(self):
+        """Cancel the group and close every open response."""
+        with self._lock:
+            self.cancelled = True
+            responses = list(self._responses)
+            self._responses.clear()
+        for response in responses:
+            response.close()
 
 
 class AISearchEngine:
     """AI-powered search engine using OpenRouter with tool calling."""
     
     def __init__(self):
-        self.wordpress_client = WordPressClient()
+        self.wordpress_client = get_client()
         self.base_url = config.openrouter_base_url
         self.headers = config.get_openrouter_headers()
+        
+        # One pooled HTTP/2 client so every request reuses the same connection
+        self.http = httpx.Client(
+            base_url=self.base_url,
+            headers=self.headers,
+            http2=True,
+            timeout=config.request_timeout,
+            limits=httpx.Limits(max_keepalive_connections=32)
+        )
         self.current_model = config.ai_model
         self.fallback_models = config.fallback_models
+        self.router = ModelRouter()
+        self.cache = self._create_cache()
         
         # Tool definition for WordPress search
         self.search_tool = {
             "type": "function",
             "function": {
                 "name": "search_wordpress",
-                "description": "Search WordPress content intelligently. Returns all available content for AI analysis - the AI will determine relevance based on semantic understanding, not just keyword matching.",
+                "description": "Search WordPress content intelligently. Returns content matching the query, or the latest content when nothing matches, for AI analysis - the AI will determine relevance based on semantic understanding, not just keyword matching.",
                 "parameters": {
                     "type": "object",
                     "properties": {
                         "query": {
                             "type": "string",
-                            "description": "The search query. Note: This tool returns all content - the AI analyzes relevance, not the tool."
+                            "description": "The search query. Use key terms; if nothing matches, the latest content is returned and the AI analyzes relevance."
                         },
                         "maxResults": {
                             "type": "integer",
@@ -42,14 +172,83 @@ class AISearchEngine:
                 }
             }
         }
+        
+        # The tool schema never changes, so serialize it once and splice the
+        # bytes into every request body
+        self._tools_json = orjson.Fragment(orjson.dumps([self.search_tool]))
+    
+    def close(self):
+        """Close the underlying HTTP client."""
+        self.http.close()
     
-    def search(self, user_query: str, max_results: Optional[int] = None) -> Dict[str, Any]:
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def clear_cache(self):
+        """Drop cached WordPress search results."""
+        self.wordpress_client.invalidate()
+    
+    def _create_cache(self):
+        """
+        Create the semantic response cache if it is enabled and available.
+        
+        Returns:
+            SemanticCache instance, or None if disabled or dependencies are missing
+        """
+        if not config.semantic_cache_enabled:
+            return None
+        
+        try:
+            from .semantic_cache import SemanticCache
+        except ImportError as e:
+            if config.verbose_logging:
+                print(f"Semantic cache disabled: {e}")
+            return None
+        
+        return SemanticCache()
+    
+    def _system_message(self, prompt: str, model: str) -> Dict[str, Any]:
+        """
+        Build a system message that is eligible for provider prompt caching.
+        
+        OpenAI-compatible providers cache long prompt prefixes automatically;
+        Anthropic models need the cacheable block marked with cache_control.
+        
+        Args:
+            prompt: System prompt text
+            model: Model the message will be sent to
+            
+        Returns:
+            System message for the chat completion payload
+        """
+        if model.startswith("anthropic/"):
+            return {
+                "role": "system",
+                "content": [
+                    {
+                        "type": "text",
+                        "text": prompt,
+                        "cache_control": {"type": "ephemeral"}
+                    }
+                ]
+            }
+        return {"role": "system", "content": prompt}
+    
+    def search(self, user_query: str, max_results: Optional[int] = None,
+               on_token: Optional[Callable[[str], None]] = None,
+               on_reset: Optional[Callable[[], None]] = None) -> Dict[str, Any]:
         """
         Perform AI-powered search using natural language query.
         
         Args:
             user_query: Natural language search query
             max_results: Maximum number of results to return
+            on_token: Called with each chunk of the AI answer as it streams in
+            on_reset: Called when the streamed answer is discarded because its
+                model failed; tokens streamed so far should be cleared
             
         Returns:
             Search results with AI analysis
@@ -57,19 +256,147 @@ class AISearchEngine:
         if max_results is None:
             max_results = config.max_results
         
-        # Try primary model first, then fallbacks
-        for model in [self.current_model] + self.fallback_models:
-            try:
-                return self._search_with_model(user_query, max_results, model)
-            except Exception as e:
-                if config.verbose_logging:
-                    print(f"Model {model} failed: {e}")
-                continue
+        # Near-duplicate questions are answered from the semantic cache
+        embedding = None
+        if self.cache is not None:
+            embedding = self.cache.embed(user_query)
+            cached = self.cache.get(embedding, max_results)
+            if cached is not None:
+                return cached
+        
+        # Race the best-performing model against staggered fallbacks, trying each model once
+        models = self.router.order(dict.fromkeys(itertools.chain((self.current_model,), self.fallback_models)))
+        try:
+            result = self._hedged_search(user_query, max_results, models, on_token, on_reset)
+        except WordPressAPIError as e:
+            # WordPress itself is failing; another model or the fallback search would hit it again
+            return self._error_result(user_query, e)
+        if result is not None:
+            if self.cache is not None:
+                self.cache.put(embedding, result, max_results)
+            return result
         
         # If all models fail, fall back to direct WordPress search
         return self._fallback_search(user_query, max_results)
     
-    def _search_with_model(self, user_query: str, max_results: int, model: str) -> Dict[str, Any]:
+    def _hedged_search(self, user_query: str, max_results: int, models: Tuple[str, ...],
+                       on_token: Optional[Callable[[str], None]] = None,
+                       on_reset: Optional[Callable[[], None]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Search with hedged requests across models.
+        
+        The first model starts immediately. Each time the running requests
+        fail to finish within the hedge delay, the next model is started in
+        parallel; a failed request starts the next model without waiting.
+        The first successful result wins and the remaining ones are cancelled
+        by closing their open responses.
+        
+        Only one model at a time streams answer tokens to on_token, so parallel
+        requests never interleave their output. It is the first model to
+        stream; if it fails, on_reset is called and the running model with the
+        most streamed text takes over, replaying what it has streamed so far.
+        
+        Args:
+            user_query: Natural language search query
+            max_results: Maximum number of results
+            models: Models to try, in order of preference
+            on_token: Called with each chunk of the AI answer as it streams in
+            on_reset: Called when the streamed answer of a failed model is discarded
+            
+        Returns:
+            Search results from the first successful model, or None if all failed
+            
+        Raises:
+            WordPressAPIError: If a model's WordPress search failed; this is not the model's fault
+        """
+        stagger = config.hedge_delay_ms / 1000
+        candidates = iter(models)
+        running = {}
+        executor = ThreadPoolExecutor(max_workers=len(models))
+        cancel = _Cancellation()
+        stream_owner = []
+        stream_buffers: Dict[str, List[str]] = {}
+        stream_lock = threading.Lock()
+        
+        def token_forwarder(model: str) -> Optional[Callable[[str], None]]:
+            if on_token is None:
+                return None
+            buffer = stream_buffers[model] = []
+            
+            def forward(token: str):
+                with stream_lock:
+                    buffer.append(token)
+                    if not stream_owner:
+                        stream_owner.append(model)
+                    if stream_owner[0] == model:
+                        on_token(token)
+            return forward
+        
+        def release_stream(model: str):
+            # Discard a failed model's tokens and hand the stream to the
+            # running model that has streamed the most
+            with stream_lock:
+                stream_buffers.pop(model, None)
+                if stream_owner != [model]:
+                    return
+                stream_owner.clear()
+                if on_reset is not None:
+                    on_reset()
+                successor = max(stream_buffers, key=lambda m: len(stream_buffers[m]), default=None)
+                if successor is not None and stream_buffers[successor]:
+                    stream_owner.append(successor)
+                    for token in stream_buffers[successor]:
+                        on_token(token)
+        
+        def launch_next() -> bool:
+            model = next(candidates, None)
+            if model is None:
+                return False
+            future = executor.submit(
+                self._search_with_model, user_query, max_results, model,
+                token_forwarder(model), cancel
+            )
+            running[future] = (model, time.monotonic())
+            return True
+        
+        try:
+            launch_next()
+            exhausted = False
+            while running:
+                done, _ = wait(running, timeout=None if exhausted else stagger, return_when=FIRST_COMPLETED)
+                if not done:
+                    # Slow response: hedge with the next model
+                    exhausted = not launch_next()
+                    continue
+                
+                for future in done:
+                    model, started = running.pop(future)
+                    try:
+                        result = future.result()
+                    except WordPressAPIError:
+                        raise
+                    except Exception as e:
+                        if config.verbose_logging:
+                            print(f"Model {model} failed: {e}")
+                        self.router.record_failure(model, self._is_unavailable(e))
+                        release_stream(model)
+                        exhausted = not launch_next()
+                        continue
+                    
+                    now = time.monotonic()
+                    self.router.record_success(model, now - started)
+                    for other_model, other_started in running.values():
+                        self.router.record_abandoned(other_model, now - other_started)
+                    return result
+            
+            return None
+        finally:
+            cancel.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _search_with_model(self, user_query: str, max_results: int, model: str,
+                           on_token: Optional[Callable[[str], None]] = None,
+                           cancel: Optional[_Cancellation] = None) -> Dict[str, Any]:
         """
         Search using a specific AI model.
         
@@ -77,6 +404,8 @@ class AISearchEngine:
             user_query: Natural language search query
             max_results: Maximum number of results
             model: AI model to use
+            on_token: Called with each chunk of the AI answer as it streams in
+            cancel: Cancellation that aborts the request
             
         Returns:
             Search results with AI analysis
@@ -85,108 +414,224 @@ class AISearchEngine:
         payload = {
             "model": model,
             "messages": [
-                {
-                    "role": "system",
-                    "content": """You are a helpful AI assistant that searches WordPress content intelligently. 
-                    
-                    When a user asks a question:
-                    1. Use the search_wordpress tool to retrieve content
-                    2. Analyze ALL returned content for relevance, even if it doesn't contain exact keywords
-                    3. Look for semantic relationships, related concepts, and contextual relevance
-                    4. Consider synonyms, related terms, and broader topics
-                    5. If content is tangentially related or could be helpful, include it
-                    6. Always provide accurate citations and source links
-                    
-                    Be flexible in your search - don't require exact keyword matches. Think about what the user is really looking for."""
-                },
+                self._system_message(_SEARCH_SYSTEM_PROMPT, model),
                 {
                     "role": "user",
                     "content": user_query
                 }
             ],
-            "tools": [self.search_tool],
+            "tools": self._tools_json,
             "tool_choice": "auto",
-            "stream": False
+            "stream": True
         }
         
         try:
-            response = requests.post(
-                f"{self.base_url}/chat/completions",
-                headers=self.headers,
-                json=payload,
-                timeout=config.request_timeout
-            )
-            response.raise_for_status()
+            result = self._stream_completion(payload, on_token, cancel)
+            return self._process_ai_response(result, payload, user_query, max_results, on_token, cancel)
+            
+        except httpx.HTTPError as e:
+            raise AIError(f"OpenRouter API request failed: {e}") from e
+        except ValidationError as e:
+            raise AIError(f"Invalid streaming response from OpenRouter: {e}") from e
+    
+    @staticmethod
+    def _is_unavailable(error: Exception) -> bool:
+        """
+        Check whether a failure means the model is temporarily unavailable.
+        
+        Args:
+            error: Exception raised by a model request
             
-            result = response.json()
-            return self._process_ai_response(result, user_query, max_results)
+        Returns:
+            True for timeouts, rate limiting, and server errors
+        """
+        cause = error.__cause__ if isinstance(error, AIError) else error
+        if isinstance(cause, httpx.TimeoutException):
+            return True
+        if isinstance(cause, httpx.HTTPStatusError):
+            status = cause.response.status_code
+            return status == 429 or status >= 500
+        return False
+    
+    def _stream_completion(self, payload: Dict[str, Any],
+                           on_token: Optional[Callable[[str], None]] = None,
+                           cancel: Optional[_Cancellation] = None) -> ChatResponse:
+        """
+        Send a streaming chat completion and assemble the full response.
+        
+        Server-sent event chunks are accumulated into a response shaped like a
+        non-streaming completion. Tool calls arrive in fragments keyed by
+        their index and are stitched back together.
+        
+        Args:
+            payload: Chat completion request payload with "stream" enabled
+            on_token: Called with each chunk of content as it arrives
+            cancel: Cancellation that aborts the request
             
-        except requests.exceptions.RequestException as e:
-            raise AIError(f"OpenRouter API request failed: {e}")
+        Returns:
+            Chat completion response with the assembled message
+        """
+        model = payload["model"]
+        content = []
+        tool_calls: Dict[int, ToolCall] = {}
+        
+        # The request is sent and billed as soon as the stream opens, so a
+        # cancelled search must not start a new one
+        if cancel is not None:
+            cancel.check()
+        
+        with self.http.stream("POST", "/chat/completions", content=orjson.dumps(payload)) as response:
+            if cancel is not None:
+                cancel.register(response)
+            response.raise_for_status()
+            
+            for line in response.iter_lines():
+                if cancel is not None:
+                    cancel.check()
+                
+                # Skip keep-alive comments and blank separators
+                if not line.startswith("data:"):
+                    continue
+                data = line[5:].strip()
+                if data == "[DONE]":
+                    break
+                
+                chunk = ChatCompletionChunk.model_validate_json(data)
+                if chunk.error is not None:
+                    raise AIError(f"OpenRouter streaming error: {chunk.error}")
+                model = chunk.model or model
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta
+                if delta is None:
+                    continue
+                
+                if delta.content:
+                    content.append(delta.content)
+                    if on_token is not None:
+                        on_token(delta.content)
+                
+                for fragment in delta.tool_calls or []:
+                    tool_call = tool_calls.get(fragment.index)
+                    if tool_call is None:
+                        tool_call = tool_calls[fragment.index] = ToolCall()
+                    if fragment.id:
+                        tool_call.id = fragment.id
+                    if fragment.function is not None:
+                        tool_call.function.name += fragment.function.name or ''
+                        tool_call.function.arguments += fragment.function.arguments or ''
+        
+        message = Message(
+            content=''.join(content) or None,
+            tool_calls=[tool_calls[i] for i in sorted(tool_calls)] or None
+        )
+        return ChatResponse(model=model, choices=[Choice(message=message)])
     
-    def _process_ai_response(self, ai_response: Dict[str, Any], user_query: str, max_results: int) -> Dict[str, Any]:
+    def _process_ai_response(self, ai_response: ChatResponse, payload: Dict[str, Any],
+                             user_query: str, max_results: int,
+                             on_token: Optional[Callable[[str], None]] = None,
+                             cancel: Optional[_Cancellation] = None) -> Dict[str, Any]:
         """
         Process AI response and execute tool calls if needed.
         
+        Tool results are appended to the same conversation and sent back to
+        the model, which answers in a single follow-up completion.
+        
         Args:
             ai_response: Response from OpenRouter API
+            payload: Request payload that produced the response
             user_query: Original user query
             max_results: Maximum number of results
+            on_token: Called with each chunk of the AI answer as it streams in
+            cancel: Cancellation that aborts the request
             
         Returns:
             Processed search results
+            
+        Raises:
+            httpx.HTTPError: If the follow-up completion fails
         """
-        try:
-            message = ai_response['choices'][0]['message']
+        message = ai_response.choices[0].message
+        
+        # Execute every tool call the AI requested
+        wordpress_results = None
+        tool_messages = []
+        for tool_call in message.tool_calls or []:
+            if tool_call.function.name != 'search_wordpress':
+                tool_messages.append({
+                    "role": "tool",
+                    "tool_call_id": tool_call.id,
+                    "content": f"Unknown tool: {tool_call.function.name}"
+                })
+                continue
             
-            # Check if AI wants to use the search tool
-            if 'tool_calls' in message:
-                tool_calls = message['tool_calls']
-                
-                for tool_call in tool_calls:
-                    if tool_call['function']['name'] == 'search_wordpress':
-                        # Execute WordPress search
-                        args = json.loads(tool_call['function']['arguments'])
-                        search_query = args.get('query', user_query)
-                        search_max_results = args.get('maxResults', max_results)
-                        
-                        wordpress_results = self.wordpress_client.search_content(
-                            search_query, 
-                            search_max_results
-                        )
-                        
-                        # Format results for AI
-                        formatted_results = self._format_results_for_ai(wordpress_results)
-                        
-                        # Get AI analysis of results
-                        analysis = self._get_ai_analysis(user_query, formatted_results)
-                        
-                        return {
-                            'query': user_query,
-                            'results': wordpress_results,
-                            'analysis': analysis,
-                            'model_used': ai_response['model'],
-                            'total_results': len(wordpress_results)
-                        }
+            try:
+                args = orjson.loads(tool_call.function.arguments or '{}')
+            except orjson.JSONDecodeError as e:
+                raise AIError(f"Invalid search_wordpress arguments: {e}")
+            search_query = args.get('query', user_query)
+            search_max_results = args.get('maxResults', max_results)
+            if not isinstance(search_max_results, int) or isinstance(search_max_results, bool):
+                raise AIError(f"Invalid search_wordpress maxResults: {search_max_results!r}")
+            # The model may narrow the search but never widen it past the caller's limit
+            search_max_results = min(search_max_results, max_results)
+            
+            results = self.wordpress_client.search_content(search_query, search_max_results, include_content=False)
+            if wordpress_results is None:
+                wordpress_results = results
             
-            # If no tool calls, return AI's direct response
+            tool_messages.append({
+                "role": "tool",
+                "tool_call_id": tool_call.id,
+                "content": self._format_results_for_ai(results)
+            })
+        
+        # If no search was made, return AI's direct response
+        if wordpress_results is None:
             return {
                 'query': user_query,
-                'results': [],
-                'analysis': message.get('content', 'No relevant content found.'),
-                'model_used': ai_response['model'],
+                'results': WordPressResults(),
+                'analysis': message.content or 'No relevant content found.',
+                'model_used': ai_response.model,
                 'total_results': 0
             }
-            
-        except (KeyError, IndexError, json.JSONDecodeError) as e:
-            raise AIError(f"Failed to process AI response: {e}")
+        
+        # Another model may have won while WordPress was searched
+        if cancel is not None:
+            cancel.check()
+        
+        # Continue the conversation with the tool results to get the answer. The
+        # tools stay declared for the history's tool calls, but the model must
+        # answer in text rather than search again
+        followup = {
+            **payload,
+            "messages": payload["messages"] + [message.model_dump(exclude_none=True)] + tool_messages,
+            "tool_choice": "none"
+        }
+        # A failed follow-up propagates, so the model is charged for it and the
+        # next model is tried instead of returning (and caching) a non-answer
+        answer = self._stream_completion(followup, on_token, cancel)
+        
+        return {
+            'query': user_query,
+            'results': wordpress_results,
+            'analysis': answer.choices[0].message.content or 'No relevant content found.',
+            'model_used': ai_response.model,
+            'total_results': len(wordpress_results)
+        }
     
-    def _format_results_for_ai(self, results: List[Dict[str, Any]]) -> str:
+    def _format_results_for_ai(self, results: WordPressResults,
+                               token_budget: int = RESULTS_TOKEN_BUDGET) -> str:
         """
         Format WordPress results for AI analysis.
         
+        Excerpts are truncated by token count and results stop being added
+        once the token budget is reached, so the prompt always fits the
+        model's context window.
+        
         Args:
-            results: List of WordPress content items
+            results: WordPress content items
+            token_budget: Maximum number of tokens for the formatted results
             
         Returns:
             Formatted string for AI
@@ -195,74 +640,26 @@ class AISearchEngine:
             return "No content found."
         
         formatted = []
-        for i, item in enumerate(results, 1):
-            formatted.append(f"""
-Result {i}:
-Title: {item['title']}
-Excerpt: {item['excerpt'][:200]}...
-URL: {item['url']}
-Author: {item['author']}
-Date: {item['date']}
-""")
+        used_tokens = 0
+        rows = zip(results.titles, results.excerpts, results.urls, results.authors, results.dates)
+        for i, (title, excerpt, url, author, date) in enumerate(rows, 1):
+            block = (
+                f"Result {i}:\n"
+                f"Title: {title}\n"
+                f"Excerpt: {_truncate_tokens(excerpt, EXCERPT_TOKEN_LIMIT)}...\n"
+                f"URL: {url}\n"
+                f"Author: {author}\n"
+                f"Date: {date}\n"
+            )
+            block_tokens = _count_tokens(block)
+            if used_tokens + block_tokens > token_budget:
+                formatted.append(f"... ({len(results) - i + 1} more results omitted)")
+                break
+            formatted.append(block)
+            used_tokens += block_tokens
         
         return "\n".join(formatted)
     
-    def _get_ai_analysis(self, user_query: str, formatted_results: str) -> str:
-        """
-        Get AI analysis of search results.
-        
-        Args:
-            user_query: Original user query
-            formatted_results: Formatted search results
-            
-        Returns:
-            AI analysis of the results
-        """
-        payload = {
-            "model": self.current_model,
-            "messages": [
-                {
-                    "role": "system",
-                    "content": """You are a helpful assistant that analyzes search results intelligently.
-                    
-                    When analyzing results:
-                    1. Consider ALL content for relevance, not just exact keyword matches
-                    2. Look for semantic relationships and contextual relevance
-                    3. Include content that might be tangentially related or helpful
-                    4. Consider synonyms, related concepts, and broader topics
-                    5. If content could be useful to the user, mention it
-                    6. Provide clear, concise answers with proper citations
-                    
-                    Be flexible and helpful - think about what would actually be useful to the user."""
-                },
-                {
-                    "role": "user",
-                    "content": f"""User Query: {user_query}
-
-Search Results:
-{formatted_results}
-
-Please provide a helpful answer based on these search results. Include relevant citations and source links."""
-                }
-            ],
-            "stream": False
-        }
-        
-        try:
-            response = requests.post(
-                f"{self.base_url}/chat/completions",
-                headers=self.headers,
-                json=payload,
-                timeout=config.request_timeout
-            )
-            response.raise_for_status()
-            
-            result = response.json()
-            return result['choices'][0]['message']['content']
-            
-        except requests.exceptions.RequestException:
-            return "Unable to analyze results at this time."
-    
     def _fallback_search(self, user_query: str, max_results: int) -> Dict[str, Any]:
         """
         Fallback search when AI models are unavailable.
@@ -275,7 +672,7 @@ Please provide a helpful answer based on these search results. Include relevant
             Basic search results
         """
         try:
-            results = self.wordpress_client.search_content(user_query, max_results)
+            results = self.wordpress_client.search_content(user_query, max_results, include_content=False)
             return {
                 'query': user_query,
                 'results': results,
@@ -284,13 +681,26 @@ Please provide a helpful answer based on these search results. Include relevant
                 'total_results': len(results)
             }
         except WordPressAPIError as e:
-            return {
-                'query': user_query,
-                'results': [],
-                'analysis': f"Search failed: {e}",
-                'model_used': 'error',
-                'total_results': 0
-            }
+            return self._error_result(user_query, e)
+    
+    def _error_result(self, user_query: str, error: WordPressAPIError) -> Dict[str, Any]:
+        """
+        Build the result returned when WordPress search fails.
+        
+        Args:
+            user_query: Search query
+            error: WordPress API failure
+            
+        Returns:
+            Empty search results describing the failure
+        """
+        return {
+            'query': user_query,
+            'results': WordPressResults(),
+            'analysis': f"Search failed: {error}",
+            'model_used': 'error',
+            'total_results': 0
+        }
     
     def test_ai_connection(self) -> bool:
         """
@@ -306,18 +716,193 @@ Please provide a helpful answer based on these search results. Include relevant
                 "max_tokens": 10
             }
             
-            response = requests.post(
-                f"{self.base_url}/chat/completions",
-                headers=self.headers,
-                json=payload,
-                timeout=config.request_timeout
-            )
+            response = self.http.post("/chat/completions", content=orjson.dumps(payload))
             response.raise_for_status()
             return True
-        except requests.exceptions.RequestException:
+        except httpx.HTTPError:
             return False
 
 
+class BatchingAISearchEngine(AISearchEngine):
+    """
+    AI search engine that coalesces concurrent queries into batched requests.
+    
+    Queries that arrive within ``batch_window`` seconds of each other (up to
+    ``max_batch_size`` of them) are answered by a single chat completion, so
+    the system prompt and per-request overhead are paid once per batch instead
+    of once per query.
+    
+    This trades latency for throughput: every query may wait up to
+    ``batch_window`` before it is sent, and a batched answer takes longer to
+    generate than a single one. Use it when many queries are issued
+    concurrently (e.g. behind a web endpoint); a single interactive user is
+    better served by AISearchEngine.
+    """
+    
+    def __init__(self, max_batch_size: int = 8, batch_window: float = 0.05):
+        super().__init__()
+        self.max_batch_size = max_batch_size
+        self.batch_window = batch_window
+        self._queue: queue.Queue = queue.Queue()
+        self._closed = False
+        self._close_lock = threading.Lock()
+        self._worker = threading.Thread(target=self._batch_worker, daemon=True)
+        self._worker.start()
+    
+    def close(self):
+        """Stop the batching worker and close the underlying HTTP client."""
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(None)
+        self._worker.join()
+        super().close()
+    
+    def search(self, user_query: str, max_results: Optional[int] = None,
+               on_token: Optional[Callable[[str], None]] = None,
+               on_reset: Optional[Callable[[], None]] = None) -> Dict[str, Any]:
+        """
+        Queue a query for the next batch and wait for its result.
+        
+        Args:
+            user_query: Natural language search query
+            max_results: Maximum number of results to return
+            on_token: Accepted for compatibility with AISearchEngine; batched
+                answers are not streamed, so it is never called
+            on_reset: Accepted for compatibility with AISearchEngine; never called
+            
+        Returns:
+            Search results with AI analysis
+            
+        Raises:
+            AIError: If the engine has been closed
+        """
+        if max_results is None:
+            max_results = config.max_results
+        
+        future: Future = Future()
+        with self._close_lock:
+            if self._closed:
+                raise AIError("Search engine is closed")
+            self._queue.put((user_query, max_results, future))
+        return future.result()
+    
+    def _batch_worker(self):
+        """Drain the queue into batches and resolve each caller's future."""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            
+            batch = [item]
+            deadline = time.monotonic() + self.batch_window
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    self._queue.put(None)
+                    break
+                batch.append(item)
+            
+            self._process_batch(batch)
+    
+    def _process_batch(self, batch: List[tuple]):
+        """
+        Answer a batch of queued queries.
+        
+        Args:
+            batch: List of (user_query, max_results, future) tuples
+        """
+        results = None
+        if len(batch) > 1:
+            try:
+                results = self._search_batch([(query, max_results) for query, max_results, _ in batch])
+            except Exception as e:
+                if config.verbose_logging:
+                    print(f"Batched search failed, answering individually: {e}")
+        
+        for i, (query, max_results, future) in enumerate(batch):
+            try:
+                if results is not None:
+                    future.set_result(results[i])
+                else:
+                    future.set_result(AISearchEngine.search(self, query, max_results))
+            except Exception as e:
+                future.set_exception(e)
+    
+    def _search_batch(self, queries: List[tuple]) -> List[Dict[str, Any]]:
+        """
+        Answer several queries with a single chat completion.
+        
+        Args:
+            queries: List of (user_query, max_results) tuples
+            
+        Returns:
+            Search results for each query, in the same order
+        """
+        wordpress_results = [
+            self.wordpress_client.search_content(query, max_results, include_content=False)
+            for query, max_results in queries
+        ]
+        
+        sections = []
+        # The queries share one prompt, so they share one results budget
+        token_budget = RESULTS_TOKEN_BUDGET // len(queries)
+        for i, ((query, _), results) in enumerate(zip(queries, wordpress_results), 1):
+            sections.append(f"{i}. {query}\n\nSearch Results:\n{self._format_results_for_ai(results, token_budget)}")
+        
+        payload = {
+            "model": self.current_model,
+            "messages": [
+                self._system_message(_BATCH_SYSTEM_PROMPT, self.current_model),
+                {
+                    "role": "user",
+                    "content": "\n\n".join(sections)
+                }
+            ],
+            "stream": False
+        }
+        
+        try:
+            response = self.http.post("/chat/completions", content=orjson.dumps(payload))
+            response.raise_for_status()
+            result = ChatResponse.model_validate_json(response.content)
+        except (httpx.HTTPError, ValidationError) as e:
+            raise AIError(f"OpenRouter API request failed: {e}")
+        
+        try:
+            content = (result.choices[0].message.content or '').strip()
+            # Models often wrap JSON output in a markdown code fence
+            if content.startswith("```"):
+                content = content.strip("`").removeprefix("json").strip()
+            answers = {answer['index']: answer for answer in orjson.loads(content)}
+            
+            batch_results = []
+            for i, ((query, _), results) in enumerate(zip(queries, wordpress_results), 1):
+                answer = answers[i]
+                analysis = answer['analysis']
+                if answer.get('citations'):
+                    analysis += "\n\n**Sources:**\n" + "\n".join(f"- {url}" for url in answer['citations'])
+                
+                batch_results.append({
+                    'query': query,
+                    'results': results,
+                    'analysis': analysis,
+                    'model_used': result.model,
+                    'total_results': len(results)
+                })
+            return batch_results
+            
+        except (KeyError, IndexError, TypeError, orjson.JSONDecodeError) as e:
+            raise AIError(f"Failed to process batched AI response: {e}")
+
+
 class AIError(Exception):
     """Exception raised for AI-related errors."""
     pass
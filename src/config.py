@@ -2,7 +2,9 @@
 Configuration management for WordPress AI Search Terminal.
 """
 
+import base64
 import os
+import sys
 from typing import Optional
 from dotenv import load_dotenv
 
@@ -16,27 +18,58 @@ class Config:
     def __init__(self):
         # AI Model Configuration
         self.openrouter_api_key: str = self._get_required_env("OPENROUTER_API_KEY")
-        self.ai_model: str = self._get_env("AI_MODEL", "z-ai/glm-4.5-air:free")
+        self.ai_model: str = sys.intern(self._get_env("AI_MODEL", "z-ai/glm-4.5-air:free"))
         
         # WordPress API Configuration
         self.wordpress_api_url: str = self._get_required_env("WORDPRESS_API_URL")
-        self.wordpress_username: str = self._get_required_env("WORDPRESS_USERNAME")
-        self.wordpress_password: str = self._get_required_env("WORDPRESS_PASSWORD")
+        self.wordpress_bearer_token: str = self._get_env("WORDPRESS_BEARER_TOKEN", "")
+        if self.wordpress_bearer_token:
+            # Token auth (e.g. a JWT plugin) makes the Basic credentials optional
+            self.wordpress_username: str = self._get_env("WORDPRESS_USERNAME", "")
+            self.wordpress_password: str = self._get_env("WORDPRESS_PASSWORD", "")
+        else:
+            self.wordpress_username = self._get_required_env("WORDPRESS_USERNAME")
+            self.wordpress_password = self._get_required_env("WORDPRESS_PASSWORD")
         
         # Application Configuration
         self.max_results: int = int(self._get_env("MAX_RESULTS", "5"))
         self.request_timeout: int = int(self._get_env("REQUEST_TIMEOUT", "30"))
+        self.hedge_delay_ms: int = int(self._get_env("HEDGE_DELAY_MS", "3000"))
+        self.search_cache_ttl: int = int(self._get_env("SEARCH_CACHE_TTL", "300"))
         self.verbose_logging: bool = self._get_env("VERBOSE_LOGGING", "false").lower() == "true"
+        self.cache_dir: str = os.path.expanduser(self._get_env("CACHE_DIR", "~/.cache/wp-ai-search"))
+        
+        # Semantic Cache Configuration
+        self.semantic_cache_enabled: bool = self._get_env("SEMANTIC_CACHE", "false").lower() == "true"
+        self.semantic_cache_threshold: float = float(self._get_env("SEMANTIC_CACHE_THRESHOLD", "0.85"))
+        self.semantic_cache_ttl: int = int(self._get_env("SEMANTIC_CACHE_TTL", "86400"))
         
         # OpenRouter Configuration
         self.openrouter_base_url: str = "https://openrouter.ai/api/v1"
         
         # Fallback models
-        self.fallback_models: list[str] = [
+        self.fallback_models: tuple[str, ...] = tuple(sys.intern(model) for model in (
             "z-ai/glm-4.5-air:free",
-            "qwen/qwen3-coder:free", 
+            "qwen/qwen3-coder:free",
             "moonshotai/kimi-k2:free"
-        ]
+        ))
+        
+        # Derived request settings, built once and shared by every client
+        if self.wordpress_bearer_token:
+            authorization = f"Bearer {self.wordpress_bearer_token}"
+        else:
+            credentials = base64.b64encode(f"{self.wordpress_username}:{self.wordpress_password}".encode()).decode()
+            authorization = f"Basic {credentials}"
+        self._wordpress_headers: dict[str, str] = {
+            "Authorization": authorization,
+            "User-Agent": "wp-ai-searcher/1.0"
+        }
+        self._openrouter_headers: dict[str, str] = {
+            "Authorization": f"Bearer {self.openrouter_api_key}",
+            "Content-Type": "application/json",
+            "HTTP-Referer": "https://wordpress-ai-search-terminal",
+            "X-Title": "WordPress AI Search Terminal"
+        }
     
     def _get_required_env(self, key: str) -> str:
         """Get a required environment variable."""
@@ -49,18 +82,13 @@ class Config:
         """Get an environment variable with a default value."""
         return os.getenv(key, default)
     
-    def get_wordpress_auth(self) -> tuple[str, str]:
-        """Get WordPress authentication credentials."""
-        return (self.wordpress_username, self.wordpress_password)
+    def get_wordpress_headers(self) -> dict[str, str]:
+        """Get WordPress API headers, including authorization (shared; do not mutate)."""
+        return self._wordpress_headers
     
     def get_openrouter_headers(self) -> dict[str, str]:
-        """Get OpenRouter API headers."""
-        return {
-            "Authorization": f"Bearer {self.openrouter_api_key}",
-            "Content-Type": "application/json",
-            "HTTP-Referer": "https://wordpress-ai-search-terminal",
-            "X-Title": "WordPress AI Search Terminal"
-        }
+        """Get OpenRouter API headers (shared; do not mutate)."""
+        return self._openrouter_headers
     
     def validate(self) -> bool:
         """Validate configuration."""
@@ -68,12 +96,17 @@ class Config:
             # Check required fields
             assert self.openrouter_api_key, "OpenRouter API key is required"
             assert self.wordpress_api_url, "WordPress API URL is required"
-            assert self.wordpress_username, "WordPress username is required"
-            assert self.wordpress_password, "WordPress password is required"
+            if not self.wordpress_bearer_token:
+                assert self.wordpress_username, "WordPress username is required"
+                assert self.wordpress_password, "WordPress password is required"
             
             # Validate numeric fields
             assert self.max_results > 0, "Max results must be positive"
             assert self.request_timeout > 0, "Request timeout must be positive"
+            assert self.hedge_delay_ms >= 0, "Hedge delay must not be negative"
+            assert self.search_cache_ttl > 0, "Search cache TTL must be positive"
+            assert 0 < self.semantic_cache_threshold <= 1, "Semantic cache threshold must be in (0, 1]"
+            assert self.semantic_cache_ttl > 0, "Semantic cache TTL must be positive"
             
             return True
         except AssertionError as e:
@@ -2,16 +2,84 @@
 Result formatting for terminal output using Rich library.
 """
 
+import re
+import threading
+import time
 from typing import List, Dict, Any
 from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
 from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.prompt import Prompt
-from rich.markdown import Markdown
 from datetime import datetime
 
+from ._wp_format import ContentItem
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    from ciso8601 import parse_datetime as _parse_iso_datetime
+except ImportError:
+    def _parse_iso_datetime(value: str) -> datetime:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+# Fallback tag stripper when selectolax is not installed
+_HTML_TAG_RE = re.compile(r'<[^>]*>')
+
+# Display format for result dates, e.g. "July 25, 2025"
+_DATE_FORMAT = '%B %d, %Y'
+
+
+class StreamingAnalysis:
+    """Render an AI answer as live-updating markdown while it streams in."""
+    
+    def __init__(self, console: Console, message: str, refresh_per_second: int = 10):
+        from rich.live import Live
+        
+        self._message = message
+        self._tokens: List[str] = []
+        self._lock = threading.Lock()
+        self._min_interval = 1 / refresh_per_second
+        self._last_render = 0.0
+        self._live = Live(
+            Text(message, style="dim"),
+            console=console,
+            refresh_per_second=refresh_per_second,
+            transient=True
+        )
+    
+    def __enter__(self) -> 'StreamingAnalysis':
+        self._live.start()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._live.stop()
+    
+    def add_token(self, token: str):
+        """Append a streamed chunk, re-rendering at most refresh_per_second times."""
+        from rich.markdown import Markdown
+        
+        with self._lock:
+            self._tokens.append(token)
+            now = time.monotonic()
+            # Markdown re-parsing is not cheap, so skip renders between refreshes
+            if now - self._last_render < self._min_interval:
+                return
+            self._last_render = now
+            text = ''.join(self._tokens)
+        
+        self._live.update(Markdown(text))
+    
+    def reset(self):
+        """Discard the streamed answer and show the waiting message again."""
+        with self._lock:
+            self._tokens.clear()
+            self._last_render = 0.0
+        
+        self._live.update(Text(self._message, style="dim"))
+
 
 class ResultFormatter:
     """Format search results for terminal display."""
@@ -46,6 +114,8 @@ class ResultFormatter:
     
     def display_search_results(self, search_data: Dict[str, Any]):
         """Display formatted search results."""
+        from rich.markdown import Markdown
+        
         query = search_data.get('query', '')
         results = search_data.get('results', [])
         analysis = search_data.get('analysis', '')
@@ -75,20 +145,19 @@ class ResultFormatter:
         else:
             self.console.print("[yellow]No relevant results found.[/yellow]\n")
     
-    def _display_result_item(self, index: int, result: Dict[str, Any]):
+    def _display_result_item(self, index: int, result: ContentItem):
         """Display a single result item."""
-        title = result.get('title', 'Untitled')
-        excerpt = result.get('excerpt', '')
-        url = result.get('url', '')
-        author = result.get('author', 'Unknown')
-        date = result.get('date', '')
+        title = result.title or 'Untitled'
+        excerpt = result.excerpt
+        url = result.url
+        author = result.author or 'Unknown'
+        date = result.date
         
         # Format date
         if date:
             try:
-                parsed_date = datetime.fromisoformat(date.replace('Z', '+00:00'))
-                formatted_date = parsed_date.strftime('%B %d, %Y')
-            except:
+                formatted_date = _parse_iso_datetime(date).strftime(_DATE_FORMAT)
+            except ValueError:
                 formatted_date = date
         else:
             formatted_date = 'Unknown date'
@@ -116,9 +185,9 @@ class ResultFormatter:
     
     def _clean_html(self, html_text: str) -> str:
         """Remove HTML tags from text."""
-        import re
-        clean = re.compile('<.*?>')
-        return re.sub(clean, '', html_text)
+        if LexborHTMLParser is not None:
+            return LexborHTMLParser(html_text).text(separator=' ', strip=True)
+        return _HTML_TAG_RE.sub('', html_text)
     
     def display_error(self, error_message: str):
         """Display error message."""
@@ -131,6 +200,8 @@ class ResultFormatter:
     
     def display_help(self):
         """Display help information."""
+        from rich.markdown import Markdown
+        
         help_text = """
 # WordPress AI Search Terminal - Help
 
@@ -138,7 +209,7 @@ class ResultFormatter:
 - Type your question naturally (e.g., "What are the latest gambling regulations?")
 - `help` - Show this help message
 - `exit` or `quit` - Exit the application
-- `clear` - Clear the screen
+- `clear` - Clear the screen and cached search results
 
 ## Examples:
 - "Tell me about advertising compliance"
@@ -162,6 +233,8 @@ class ResultFormatter:
     
     def display_loading(self, message: str = "Searching..."):
         """Display loading spinner."""
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+        
         progress = Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -172,8 +245,14 @@ class ResultFormatter:
         progress.start()
         return progress
     
+    def stream_analysis(self, message: str = "Searching...") -> StreamingAnalysis:
+        """Create a live view that shows the AI answer as it streams in."""
+        return StreamingAnalysis(self.console, message)
+    
     def get_user_input(self) -> str:
         """Get user input with styled prompt."""
+        from rich.prompt import Prompt
+        
         return Prompt.ask("\n[bold green]Search[/bold green]")
     
     def display_model_info(self, model: str):
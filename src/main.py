@@ -6,25 +6,35 @@ import sys
 import signal
 from typing import Optional
 import click
-from rich.console import Console
-from rich.prompt import Prompt
-
-from src.config import config
-from src.wordpress_client import WordPressClient
-from src.ai_search import AISearchEngine
-from src.formatters import ResultFormatter
 
 
 class WPAISearchTerminal:
     """Main terminal application for WordPress AI Search."""
     
     def __init__(self):
+        # Imported here so `--help` and `--version` don't pay for loading
+        # rich, the HTTP clients, or the environment configuration
+        from rich.console import Console
+        from src.config import config
+        from src.wordpress_client import get_client
+        from src.ai_search import AISearchEngine
+        from src.formatters import ResultFormatter
+        
+        self.config = config
         self.console = Console()
         self.formatter = ResultFormatter()
-        self.wordpress_client = WordPressClient()
+        self.wordpress_client = get_client()
         self.ai_engine = AISearchEngine()
         self.running = True
         
+        # Interactive commands, keyed by lowercased input
+        self.commands = {
+            'exit': self._exit_command,
+            'quit': self._exit_command,
+            'help': self.formatter.display_help,
+            'clear': self._clear_command
+        }
+        
         # Set up signal handlers for graceful exit
         signal.signal(signal.SIGINT, self._signal_handler)
         signal.signal(signal.SIGTERM, self._signal_handler)
@@ -39,7 +49,7 @@ class WPAISearchTerminal:
         """Start the terminal application."""
         try:
             # Validate configuration
-            if not config.validate():
+            if not self.config.validate():
                 self.console.print("[red]Configuration validation failed. Please check your .env file.[/red]")
                 sys.exit(1)
             
@@ -59,11 +69,11 @@ class WPAISearchTerminal:
                 self.console.print("[yellow]AI model connection failed. Will use fallback search.[/yellow]")
             
             # Display current model info
-            self.formatter.display_model_info(config.ai_model)
+            self.formatter.display_model_info(self.config.ai_model)
             
             # Handle direct query if provided
             if query:
-                self._process_query(query, max_results or config.max_results)
+                self._process_query(query, max_results or self.config.max_results)
                 return
             
             # Start interactive mode
@@ -85,38 +95,41 @@ class WPAISearchTerminal:
                 user_input = self.formatter.get_user_input()
                 
                 # Handle commands
-                if user_input.lower() in ['exit', 'quit']:
-                    self.console.print("[yellow]Goodbye![/yellow]")
-                    break
-                elif user_input.lower() == 'help':
-                    self.formatter.display_help()
+                command = user_input.strip().lower()
+                action = self.commands.get(command)
+                if action is not None:
+                    action()
                     continue
-                elif user_input.lower() == 'clear':
-                    self.formatter.clear_screen()
-                    self.formatter.display_welcome()
-                    continue
-                elif not user_input.strip():
+                elif not command:
                     continue
                 
                 # Process search query
-                self._process_query(user_input, config.max_results)
+                self._process_query(user_input, self.config.max_results)
                 
             except KeyboardInterrupt:
                 self.console.print("\n[yellow]Use 'exit' to quit or continue searching...[/yellow]")
             except Exception as e:
                 self.formatter.display_error(f"Error processing query: {e}")
     
+    def _exit_command(self):
+        """Leave interactive mode."""
+        self.console.print("[yellow]Goodbye![/yellow]")
+        self.running = False
+    
+    def _clear_command(self):
+        """Clear the screen and cached search results."""
+        self.ai_engine.clear_cache()
+        self.formatter.clear_screen()
+        self.formatter.display_welcome()
+    
     def _process_query(self, query: str, max_results: int):
         """Process a search query."""
         try:
-            # Show loading indicator
-            progress = self.formatter.display_loading("Searching WordPress content...")
-            
-            # Perform search
-            search_data = self.ai_engine.search(query, max_results)
-            
-            # Stop loading indicator
-            progress.stop()
+            # Perform search, showing the answer live as it streams in
+            with self.formatter.stream_analysis("Searching WordPress content...") as stream:
+                search_data = self.ai_engine.search(
+                    query, max_results, on_token=stream.add_token, on_reset=stream.reset
+                )
             
             # Display results
             self.formatter.display_search_results(search_data)
@@ -0,0 +1,194 @@
+"""
+Latency and health tracking for AI model selection.
+"""
+
+import itertools
+import os
+import threading
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+import orjson
+
+from .config import config
+
+
+# Weight of the newest observation in the moving averages
+EWMA_ALPHA = 0.2
+
+# How long a model is skipped after a timeout or server error
+UNHEALTHY_SECONDS = 60.0
+
+# Error rate above which a model is tried after healthier ones
+ERROR_RATE_THRESHOLD = 0.5
+
+# Seconds for an unrefreshed error rate to decay to half its value
+ERROR_HALF_LIFE = 600.0
+
+
+class ModelRouter:
+    """
+    Order candidate models by recent latency and reliability.
+    
+    Each model keeps an exponentially weighted moving average of its
+    response latency and error rate; error rates also decay over time so
+    old failures are forgotten. Models that recently timed out or
+    returned a server error are marked unhealthy for a short period and
+    tried last. Statistics are persisted so they carry over between runs.
+    """
+    
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or os.path.join(config.cache_dir, "model_stats.json")
+        
+        # model -> (ewma_latency_s, ewma_error_rate, updated_at)
+        self.model_stats: Dict[str, Tuple[float, float, float]] = {}
+        self.unhealthy_until: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._load()
+    
+    def order(self, models: Iterable[str]) -> Tuple[str, ...]:
+        """
+        Sort models so the fastest healthy one is tried first.
+        
+        Unhealthy and error-prone models move behind the others. Within
+        each of those groups, models with known latency are reordered by
+        latency among their own positions, while models without latency
+        data keep their configured position. The primary model therefore
+        stays first until there is evidence against it.
+        
+        Args:
+            models: Candidate models in configured order
+        
+        Returns:
+            Models in the order they should be tried
+        """
+        now = time.time()
+        with self._lock:
+            stats = {}
+            for model in models:
+                latency, error_rate = self._current(model, now)
+                unhealthy = self.unhealthy_until.get(model, 0.0) > now
+                stats[model] = ((unhealthy, error_rate > ERROR_RATE_THRESHOLD), latency)
+        
+        # Stable sort: configured order is kept within each health group
+        ranked = sorted(stats, key=lambda model: stats[model][0])
+        ordered = []
+        for _, group in itertools.groupby(ranked, key=lambda model: stats[model][0]):
+            members = list(group)
+            by_latency = iter(sorted(
+                (model for model in members if stats[model][1] != float('inf')),
+                key=lambda model: stats[model][1]
+            ))
+            ordered.extend(
+                next(by_latency) if stats[model][1] != float('inf') else model
+                for model in members
+            )
+        return tuple(ordered)
+    
+    def record_success(self, model: str, latency: float):
+        """
+        Record a successful response.
+        
+        Args:
+            model: Model that responded
+            latency: Seconds the request took
+        """
+        with self._lock:
+            self._update(model, latency, 0.0)
+            self.unhealthy_until.pop(model, None)
+        self._save()
+    
+    def record_abandoned(self, model: str, elapsed: float):
+        """
+        Record a request that was still running when another model won.
+        
+        The elapsed time is only a lower bound on the model's latency, so it
+        can raise the estimate but never lower it, and a model without a
+        measured latency is left unmeasured.
+        
+        Args:
+            model: Model that had not responded yet
+            elapsed: Seconds the request had been running
+        """
+        with self._lock:
+            now = time.time()
+            latency, error_rate = self._current(model, now)
+            if latency == float('inf') or elapsed <= latency:
+                return
+            self.model_stats[model] = (elapsed, error_rate, now)
+        self._save()
+    
+    def record_failure(self, model: str, unavailable: bool):
+        """
+        Record a failed request.
+        
+        Args:
+            model: Model that failed
+            unavailable: True for timeouts and server errors, which mark the model unhealthy
+        """
+        with self._lock:
+            self._update(model, None, 1.0)
+            if unavailable:
+                self.unhealthy_until[model] = time.time() + UNHEALTHY_SECONDS
+        self._save()
+    
+    def _current(self, model: str, now: float) -> Tuple[float, float]:
+        """
+        Return a model's latency and its error rate decayed to now.
+        
+        Error rates fade while a model is not refreshed, so a model that is
+        tried last because of old failures gets back into rotation.
+        """
+        latency, error_rate, updated_at = self.model_stats.get(model, (float('inf'), 0.0, now))
+        if error_rate and now > updated_at:
+            error_rate *= 0.5 ** ((now - updated_at) / ERROR_HALF_LIFE)
+        return latency, error_rate
+    
+    def _update(self, model: str, latency: Optional[float] = None, error: Optional[float] = None):
+        """Fold an observation into a model's moving averages."""
+        now = time.time()
+        # A new model starts as error-free, so a single failure is blended
+        # in like any other observation instead of setting the rate to 1.0
+        ewma_latency, ewma_error = self._current(model, now)
+        if latency is not None:
+            if ewma_latency == float('inf'):
+                ewma_latency = latency
+            else:
+                ewma_latency = (1 - EWMA_ALPHA) * ewma_latency + EWMA_ALPHA * latency
+        if error is not None:
+            ewma_error = (1 - EWMA_ALPHA) * ewma_error + EWMA_ALPHA * error
+        self.model_stats[model] = (ewma_latency, ewma_error, now)
+    
+    def _load(self):
+        """Load persisted statistics, ignoring a missing or corrupt file."""
+        try:
+            with open(self.path, 'rb') as f:
+                data = orjson.loads(f.read())
+            for model, stats in data.items():
+                latency = stats['latency'] if stats['latency'] is not None else float('inf')
+                self.model_stats[model] = (latency, stats['error_rate'], stats.get('updated_at', 0.0))
+                self.unhealthy_until[model] = stats.get('unhealthy_until', 0.0)
+        except (OSError, orjson.JSONDecodeError, KeyError, TypeError, AttributeError):
+            return
+    
+    def _save(self):
+        """Persist statistics to disk."""
+        with self._lock:
+            data = {
+                model: {
+                    # JSON has no infinity; None marks an unknown latency
+                    'latency': latency if latency != float('inf') else None,
+                    'error_rate': error_rate,
+                    'updated_at': updated_at,
+                    'unhealthy_until': self.unhealthy_until.get(model, 0.0)
+                }
+                for model, (latency, error_rate, updated_at) in self.model_stats.items()
+            }
+        
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, 'wb') as f:
+                f.write(orjson.dumps(data))
+        except OSError as e:
+            if config.verbose_logging:
+                print(f"Failed to save model statistics: {e}")
@@ -0,0 +1,78 @@
+"""
+Typed models for OpenRouter chat completion responses.
+"""
+
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel
+
+
+class FunctionCall(BaseModel):
+    """Function name and JSON-encoded arguments of a tool call."""
+    
+    name: str = ""
+    arguments: str = ""
+
+
+class ToolCall(BaseModel):
+    """Tool call requested by the model."""
+    
+    id: str = ""
+    type: str = "function"
+    function: FunctionCall = FunctionCall()
+
+
+class Message(BaseModel):
+    """Assistant message of a chat completion."""
+    
+    role: str = "assistant"
+    content: Optional[str] = None
+    tool_calls: Optional[List[ToolCall]] = None
+
+
+class Choice(BaseModel):
+    """Single completion choice."""
+    
+    message: Message
+
+
+class ChatResponse(BaseModel):
+    """Chat completion response."""
+    
+    model: str
+    choices: List[Choice]
+
+
+class FunctionCallDelta(BaseModel):
+    """Fragment of a streamed tool call's function."""
+    
+    name: Optional[str] = None
+    arguments: Optional[str] = None
+
+
+class ToolCallDelta(BaseModel):
+    """Fragment of a streamed tool call, keyed by its index."""
+    
+    index: int = 0
+    id: Optional[str] = None
+    function: Optional[FunctionCallDelta] = None
+
+
+class Delta(BaseModel):
+    """Incremental message content of a streamed chunk."""
+    
+    content: Optional[str] = None
+    tool_calls: Optional[List[ToolCallDelta]] = None
+
+
+class ChunkChoice(BaseModel):
+    """Single choice of a streamed chunk."""
+    
+    delta: Optional[Delta] = None
+
+
+class ChatCompletionChunk(BaseModel):
+    """Server-sent event chunk of a streamed chat completion."""
+    
+    model: Optional[str] = None
+    choices: Optional[List[ChunkChoice]] = None
+    error: Optional[Dict[str, Any]] = None
@@ -0,0 +1,233 @@
+"""
+Semantic response cache for AI search results.
+
+Near-duplicate questions are answered from disk instead of re-running the
+OpenRouter tool-call and analysis round trips. Requires the optional
+``numpy`` and ``sentence-transformers`` packages (``numba`` accelerates
+similarity ranking and ``hnswlib`` is used for large caches when installed).
+"""
+
+import os
+import pickle
+import time
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from sentence_transformers import SentenceTransformer
+
+try:
+    import hnswlib
+except ImportError:
+    hnswlib = None
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+from .config import config
+
+
+EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+EMBEDDING_DIM = 384
+
+# Above this many entries an HNSW index replaces the brute-force matmul
+HNSW_THRESHOLD = 10_000
+
+
+if numba is not None:
+    @numba.njit(fastmath=True, parallel=True, cache=True)
+    def cosine_topk(mat: np.ndarray, q: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Find the k rows of mat most similar to q.
+        
+        Rows and query must be L2-normalized float32 vectors, so the dot
+        product is the cosine similarity.
+        
+        Args:
+            mat: Matrix of shape (N, D)
+            q: Query vector of shape (D,)
+            k: Number of rows to return
+        
+        Returns:
+            Row indices and similarities, best first
+        """
+        n, d = mat.shape
+        sims = np.empty(n, dtype=np.float32)
+        for i in numba.prange(n):
+            acc = np.float32(0.0)
+            for j in range(d):
+                acc += mat[i, j] * q[j]
+            sims[i] = acc
+        
+        # Insertion into a small sorted buffer beats a full sort for small k
+        k = min(k, n)
+        top_idx = np.full(k, -1, dtype=np.int64)
+        top_sims = np.full(k, -np.inf, dtype=np.float32)
+        for i in range(n):
+            sim = sims[i]
+            if sim <= top_sims[k - 1]:
+                continue
+            pos = k - 1
+            while pos > 0 and top_sims[pos - 1] < sim:
+                top_sims[pos] = top_sims[pos - 1]
+                top_idx[pos] = top_idx[pos - 1]
+                pos -= 1
+            top_sims[pos] = sim
+            top_idx[pos] = i
+        return top_idx, top_sims
+    
+    # Compile now rather than on the first search
+    cosine_topk(np.zeros((1, EMBEDDING_DIM), dtype=np.float32), np.zeros(EMBEDDING_DIM, dtype=np.float32), 1)
+else:
+    def cosine_topk(mat: np.ndarray, q: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Find the k rows of mat most similar to q.
+        
+        Args:
+            mat: Matrix of shape (N, D) of L2-normalized rows
+            q: L2-normalized query vector of shape (D,)
+            k: Number of rows to return
+        
+        Returns:
+            Row indices and similarities, best first
+        """
+        sims = mat @ q
+        k = min(k, len(sims))
+        idx = np.argpartition(-sims, k - 1)[:k]
+        idx = idx[np.argsort(-sims[idx])]
+        return idx, sims[idx]
+
+
+class SemanticCache:
+    """On-disk cache of search results keyed by query embedding."""
+    
+    def __init__(self, cache_dir: Optional[str] = None, threshold: Optional[float] = None,
+                 ttl: Optional[int] = None):
+        self.cache_dir = cache_dir or config.cache_dir
+        self.threshold = threshold if threshold is not None else config.semantic_cache_threshold
+        self.ttl = ttl if ttl is not None else config.semantic_cache_ttl
+        
+        self.model = SentenceTransformer(EMBEDDING_MODEL)
+        
+        # Parallel stores: row i of embeddings belongs to entries[i]
+        self.embeddings: np.ndarray = np.empty((0, EMBEDDING_DIM), dtype=np.float32)
+        self.entries: List[Dict[str, Any]] = []
+        self._index = None
+        
+        self._embeddings_path = os.path.join(self.cache_dir, "semantic_embeddings.npy")
+        self._entries_path = os.path.join(self.cache_dir, "semantic_entries.pkl")
+        self._load()
+    
+    def embed(self, text: str) -> np.ndarray:
+        """
+        Embed a query into an L2-normalized vector.
+        
+        Args:
+            text: Query text
+        
+        Returns:
+            Normalized embedding of shape (EMBEDDING_DIM,)
+        """
+        return self.model.encode([text], normalize_embeddings=True)[0].astype(np.float32)
+    
+    def get(self, embedding: np.ndarray, max_results: int) -> Optional[Dict[str, Any]]:
+        """
+        Look up the closest cached result for an embedding.
+        
+        Args:
+            embedding: Normalized query embedding
+            max_results: Result limit the caller asked for
+        
+        Returns:
+            Cached search result, or None on a miss
+        """
+        if not self.entries:
+            return None
+        
+        i, similarity = self._nearest(embedding)
+        if similarity < self.threshold:
+            return None
+        
+        entry = self.entries[i]
+        if entry['expires_at'] < time.time() or entry['max_results'] != max_results:
+            return None
+        return entry['payload']
+    
+    def put(self, embedding: np.ndarray, payload: Dict[str, Any], max_results: int):
+        """
+        Store a search result under its query embedding.
+        
+        Args:
+            embedding: Normalized query embedding
+            payload: Search result to cache
+            max_results: Result limit the payload was produced with
+        """
+        self.embeddings = np.vstack([self.embeddings, embedding[np.newaxis, :]])
+        self.entries.append({
+            'payload': payload,
+            'max_results': max_results,
+            'expires_at': time.time() + self.ttl
+        })
+        
+        if self._index is not None:
+            if self._index.get_current_count() >= self._index.get_max_elements():
+                self._index.resize_index(2 * self._index.get_max_elements())
+            self._index.add_items(embedding[np.newaxis, :], [len(self.entries) - 1])
+        elif len(self.entries) > HNSW_THRESHOLD:
+            self._build_index()
+        
+        self._save()
+    
+    def _nearest(self, embedding: np.ndarray) -> tuple[int, float]:
+        """Return the index and cosine similarity of the closest entry."""
+        if self._index is not None:
+            labels, distances = self._index.knn_query(embedding, k=1)
+            return int(labels[0][0]), 1.0 - float(distances[0][0])
+        
+        indices, similarities = cosine_topk(self.embeddings, embedding, 1)
+        return int(indices[0]), float(similarities[0])
+    
+    def _build_index(self):
+        """Build an HNSW index over the cached embeddings when hnswlib is available."""
+        if hnswlib is None:
+            return
+        
+        index = hnswlib.Index(space='cosine', dim=EMBEDDING_DIM)
+        index.init_index(max_elements=max(2 * len(self.entries), HNSW_THRESHOLD))
+        index.add_items(self.embeddings, np.arange(len(self.entries)))
+        self._index = index
+    
+    def _load(self):
+        """Load cached entries from disk, dropping expired ones."""
+        if not (os.path.exists(self._embeddings_path) and os.path.exists(self._entries_path)):
+            return
+        
+        try:
+            embeddings = np.load(self._embeddings_path)
+            with open(self._entries_path, 'rb') as f:
+                entries = pickle.load(f)
+        except (OSError, ValueError, pickle.UnpicklingError, EOFError):
+            return
+        
+        if len(entries) != len(embeddings):
+            return
+        
+        now = time.time()
+        keep = [i for i, entry in enumerate(entries) if entry['expires_at'] >= now]
+        self.embeddings = embeddings[keep].astype(np.float32)
+        self.entries = [entries[i] for i in keep]
+        
+        if len(self.entries) > HNSW_THRESHOLD:
+            self._build_index()
+    
+    def _save(self):
+        """Persist cached entries to disk."""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            np.save(self._embeddings_path, self.embeddings)
+            with open(self._entries_path, 'wb') as f:
+                pickle.dump(self.entries, f)
+        except OSError as e:
+            if config.verbose_logging:
+                print(f"Failed to save semantic cache: {e}")
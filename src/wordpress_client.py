@@ -2,144 +2,609 @@
 WordPress API client for content search and retrieval.
 """
 
-import requests
+import asyncio
+import functools
+import httpx
+import math
+import orjson
+import random
+import threading
 import time
-from typing import List, Dict, Any, Optional
-from requests.auth import HTTPBasicAuth
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
+from email.utils import parsedate_to_datetime
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Tuple, Union
+from cachetools import LRUCache, TTLCache
 from .config import config
+from ._wp_format import ContentItem, format_content_item, format_content_items
 
+try:
+    import h2
+except ImportError:
+    h2 = None
 
-class WordPressClient:
-    """Client for interacting with WordPress REST API."""
+
+# Fields read by format_content_item; the server omits everything else
+CONTENT_FIELDS = 'id,title,excerpt,content,url,date,author,type,slug'
+
+# The same without the full post body, for callers that only show excerpts
+SUMMARY_FIELDS = 'id,title,excerpt,url,date,author,type,slug'
+
+# Largest page the REST API serves; bigger requests are paginated
+MAX_PER_PAGE = 100
+
+# Retries for throttled (429) and failing (5xx) requests
+RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
+MAX_RETRIES = 4
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 30.0
+
+
+@dataclass
+class WordPressResults:
+    """
+    WordPress content items stored column-wise.
+    
+    Each field holds one attribute for every item, so consumers that only
+    need a few attributes iterate those lists directly. Indexing returns a
+    ContentItem row and slicing returns a new WordPressResults.
+    """
+    ids: List[Optional[int]] = field(default_factory=list)
+    titles: List[str] = field(default_factory=list)
+    excerpts: List[str] = field(default_factory=list)
+    contents: List[str] = field(default_factory=list)
+    urls: List[str] = field(default_factory=list)
+    dates: List[str] = field(default_factory=list)
+    authors: List[str] = field(default_factory=list)
+    types: List[str] = field(default_factory=list)
+    slugs: List[str] = field(default_factory=list)
+    
+    @classmethod
+    def from_items(cls, items: Iterable[ContentItem]) -> 'WordPressResults':
+        """
+        Build column storage from content items.
+        
+        Args:
+            items: Content items
+            
+        Returns:
+            Results holding the items column-wise
+        """
+        columns = list(zip(*items))
+        if not columns:
+            return cls()
+        return cls(*map(list, columns))
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+    
+    def __iter__(self) -> Iterator[ContentItem]:
+        return map(ContentItem._make, zip(*self._columns()))
+    
+    def __getitem__(self, index: Union[int, slice]) -> Union[ContentItem, 'WordPressResults']:
+        if isinstance(index, slice):
+            return WordPressResults(*(column[index] for column in self._columns()))
+        return ContentItem(*(column[index] for column in self._columns()))
+    
+    def _columns(self) -> List[List[Any]]:
+        """Return the column lists in ContentItem field order."""
+        return [getattr(self, f.name) for f in fields(self)]
+
+
+class _WordPressClientBase:
+    """State and helpers shared by the sync and async WordPress clients."""
     
     def __init__(self):
         self.base_url = config.wordpress_api_url
-        self.auth = HTTPBasicAuth(*config.get_wordpress_auth())
-        self.session = requests.Session()
-        self.session.auth = self.auth
-        self.session.timeout = config.request_timeout
         
-        # Rate limiting
-        self.last_request_time = 0
-        self.min_request_interval = 0.1  # 100ms between requests
+        # Request parameters, built once. The embed context leaves raw field
+        # variants, links and meta out of list responses, but core endpoints
+        # also drop content in it, so it is only used for summary searches.
+        # Single items keep the default view context limited to the fields we read
+        self._summary_params = {'content_format': 'plain', 'context': 'embed', '_fields': SUMMARY_FIELDS}
+        self._content_params = {'content_format': 'plain', '_fields': CONTENT_FIELDS}
+        self._item_params = {'_fields': CONTENT_FIELDS}
+        self._probe_params = {'per_page': 1, '_fields': 'id'}
+        
+        # Rate limiting with a token bucket: bursts of up to 10 requests, 10 requests/second on average
+        self._rate = 10.0
+        self._capacity = 10.0
+        self._tokens = self._capacity
+        self._last = time.monotonic()
+        self._rate_lock = threading.Lock()
+        
+        # Repeated lookups within the TTL are served from memory
+        self._search_cache: TTLCache = TTLCache(maxsize=256, ttl=config.search_cache_ttl)
+        self._id_cache: TTLCache = TTLCache(maxsize=1024, ttl=300)
+        self._cache_lock = threading.Lock()
+        
+        # content_id -> (ETag, item) for conditional requests once the TTL expires,
+        # bounded so the least recently used entries are evicted
+        self._etags: LRUCache = LRUCache(maxsize=4096)
+    
+    def set_bearer_token(self, token: str):
+        """
+        Switch to a new bearer token without rebuilding the HTTP client.
+        
+        The connection pool is kept; only requests sent afterwards use the
+        new token.
+        
+        Args:
+            token: WordPress bearer token
+        """
+        self.session.headers['Authorization'] = f"Bearer {token}"
+    
+    def invalidate(self):
+        """Drop all cached search results and content items."""
+        with self._cache_lock:
+            self._search_cache.clear()
+            self._id_cache.clear()
+            self._etags.clear()
+    
+    def _reserve_token(self) -> float:
+        """
+        Take a token from the bucket.
+        
+        The bucket may go into debt, so concurrent callers queue up behind
+        each other without holding the lock while they wait.
+        
+        Returns:
+            Seconds to wait before sending the request
+        """
+        with self._rate_lock:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._last) * self._rate) - 1
+            self._last = now
+            return -self._tokens / self._rate if self._tokens < 0 else 0.0
+    
+    def _search_key(self, query: str, max_results: Optional[int],
+                    include_content: bool) -> Tuple[str, int, bool]:
+        """
+        Build the cache key for a search, applying the default result count.
+        
+        per_page must be positive, so zero or negative counts ask for a
+        single item.
+        """
+        if max_results is None:
+            max_results = config.max_results
+        return (query, max(1, max_results), include_content)
+    
+    def _search_params(self, query: str, include_content: bool) -> Dict[str, Any]:
+        """Build the list endpoint parameters for a server-side search."""
+        params = self._content_params if include_content else self._summary_params
+        return {**params, 'search': query}
+    
+    @staticmethod
+    def _fallback_params(params: Dict[str, Any], content: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        Return the parameters for the no-match fallback, or None if it isn't needed.
+        
+        If the keywords matched nothing, the latest content is fetched
+        instead so the AI can still look for semantically related posts.
+        """
+        if content or not params.get('search'):
+            return None
+        return {key: value for key, value in params.items() if key != 'search'}
+    
+    @staticmethod
+    def _first_page_params(params: Dict[str, Any], max_results: int) -> Dict[str, Any]:
+        """Add the page size for max_results, capped at the largest page the API serves."""
+        return {**params, 'per_page': min(max_results, MAX_PER_PAGE)}
+    
+    @staticmethod
+    def _more_page_params(response: httpx.Response, params: Dict[str, Any],
+                          max_results: int) -> List[Dict[str, Any]]:
+        """
+        Plan the pages still needed after the first one.
+        
+        Args:
+            response: First page response, reporting X-WP-TotalPages
+            params: First page parameters
+            max_results: Maximum number of items wanted
+        
+        Returns:
+            Parameters for each further page, in page order
+        """
+        total_pages = int(response.headers.get('X-WP-TotalPages', '1'))
+        last_page = min(math.ceil(max_results / params['per_page']), total_pages)
+        return [{**params, 'page': page} for page in range(2, last_page + 1)]
+    
+    def _cached_search(self, key: Tuple[str, int, bool]) -> Optional[WordPressResults]:
+        """Return a copy of cached search results, or None on a miss."""
+        with self._cache_lock:
+            cached = self._search_cache.get(key)
+        # Slicing copies the columns so callers can't mutate the cached entry
+        return cached[:] if cached is not None else None
+    
+    def _store_search(self, key: Tuple[str, int, bool], content: List[Dict[str, Any]]) -> WordPressResults:
+        """Format and cache the items found by a search and return a copy for the caller."""
+        query, max_results, _ = key
+        results = self._filter_content_by_query(content, query)[:max_results]
+        with self._cache_lock:
+            self._search_cache[key] = results
+        return results[:]
+    
+    def _cached_item(self, content_id: int) -> Tuple[Optional[ContentItem], Optional[Dict[str, str]], Optional[ContentItem]]:
+        """Return the cached item, plus the conditional request headers and stored item for revalidation."""
+        with self._cache_lock:
+            cached = self._id_cache.get(content_id)
+            etag, stored = self._etags.get(content_id, (None, None))
+        return cached, {'If-None-Match': etag} if etag else None, stored
+    
+    def _store_item(self, content_id: int, response: httpx.Response,
+                    stored: Optional[ContentItem]) -> ContentItem:
+        """
+        Build a content item from an item response and cache it with its ETag.
+        
+        A 304 Not Modified reuses the stored item and skips the body entirely.
+        Items are immutable, so no copy is needed.
+        """
+        if response.status_code == 304 and stored is not None:
+            item = stored
+        else:
+            item = format_content_item(orjson.loads(response.content))
+        
+        etag = response.headers.get('ETag')
+        with self._cache_lock:
+            self._id_cache[content_id] = item
+            if etag:
+                self._etags[content_id] = (etag, item)
+        return item
+    
+    def _filter_content_by_query(self, content: List[Dict[str, Any]], query: str) -> WordPressResults:
+        """
+        Format the server's matches and let AI handle relevance ranking.
+        
+        Args:
+            content: List of content items from API
+            query: Search query string (already applied by the server)
+        
+        Returns:
+            All content items for AI to analyze
+        """
+        # Return all content and let the AI determine relevance
+        return WordPressResults.from_items(format_content_items(content))
+
+
+class WordPressClient(_WordPressClientBase):
+    """Client for interacting with WordPress REST API."""
+    
+    def __init__(self):
+        super().__init__()
+        
+        # One pooled client shared by all threads. HTTP/2 multiplexes concurrent
+        # requests over a single connection when h2 is installed; the transport
+        # retries connection failures, status retries are handled in _get
+        self.session = httpx.Client(
+            # The Authorization header is precomputed, so no per-request auth flow
+            headers=config.get_wordpress_headers(),
+            timeout=config.request_timeout,
+            follow_redirects=True,
+            transport=httpx.HTTPTransport(
+                http2=h2 is not None,
+                retries=3,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=32)
+            )
+        )
     
     def _rate_limit(self):
-        """Implement basic rate limiting."""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        if time_since_last < self.min_request_interval:
-            time.sleep(self.min_request_interval - time_since_last)
-        self.last_request_time = time.time()
+        """Take a token from the bucket, waiting for one to accumulate if it is empty."""
+        wait = self._reserve_token()
+        if wait:
+            time.sleep(wait)
     
-    def search_content(self, query: str, max_results: Optional[int] = None) -> List[Dict[str, Any]]:
+    def search_content(self, query: str, max_results: Optional[int] = None,
+                       include_content: bool = True) -> WordPressResults:
         """
         Search WordPress content using the provided API endpoint.
         
+        Matching is done by the server. If nothing matches, the latest
+        content is returned instead so the AI can still look for
+        semantically related posts.
+        
         Args:
             query: Search query string
             max_results: Maximum number of results to return
-            
+            include_content: Fetch full post bodies; without them only excerpts are returned
+        
         Returns:
-            List of content items with metadata
+            Content items with metadata
         """
-        if max_results is None:
-            max_results = config.max_results
-            
-        self._rate_limit()
+        key = self._search_key(query, max_results, include_content)
+        cached = self._cached_search(key)
+        if cached is not None:
+            return cached
         
         try:
             # Use the specific API endpoint provided
-            params = {
-                'content_format': 'plain',
-                'per_page': min(max_results, 100)  # API limit
-            }
+            params = self._search_params(query, include_content)
             
-            response = self.session.get(
-                self.base_url,
-                params=params,
-                timeout=config.request_timeout
-            )
-            response.raise_for_status()
-            
-            # Parse and filter results based on query
-            all_content = response.json()
-            filtered_content = self._filter_content_by_query(all_content, query)
+            content = self._get_content_list(params, key[1])
+            fallback = self._fallback_params(params, content)
+            if fallback is not None:
+                content = self._get_content_list(fallback, key[1])
+        
+        except (httpx.HTTPError, ValueError) as e:
+            raise _api_error(e)
+        
+        return self._store_search(key, content)
+    
+    def _get(self, url: str, params: Optional[Dict[str, Any]] = None,
+             headers: Optional[Dict[str, str]] = None) -> httpx.Response:
+        """
+        Send a rate-limited GET, retrying throttled and failed requests.
+        
+        A 429 waits for the server's Retry-After when it sends one; other
+        retries back off exponentially with jitter.
+        
+        Args:
+            url: Request URL
+            params: Query parameters
+            headers: Extra request headers
+        
+        Returns:
+            Successful response
+        
+        Raises:
+            httpx.HTTPError: If the request still fails after retrying
+        """
+        delay = RETRY_BASE_DELAY
+        for attempt in range(MAX_RETRIES + 1):
+            self._rate_limit()
+            response = self.session.get(url, params=params, headers=headers)
+            if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                break
             
-            return filtered_content[:max_results]
+            wait, delay = _retry_wait(response, delay)
+            time.sleep(wait)
+        
+        return _check_status(response)
+    
+    def _get_content_list(self, params: Dict[str, Any], max_results: int) -> List[Dict[str, Any]]:
+        """
+        Fetch content from the list endpoint, paginating past the page size cap.
+        
+        The first page reports X-WP-TotalPages; any further pages needed
+        for max_results are fetched concurrently.
+        
+        Args:
+            params: Query parameters
+            max_results: Maximum number of items wanted
+        
+        Returns:
+            Raw content items from the API, in page order
+        """
+        params = self._first_page_params(params, max_results)
+        response = self._get(self.base_url, params=params)
+        content = _read_list(response)
+        
+        more_pages = self._more_page_params(response, params, max_results)
+        if more_pages:
+            def fetch_page(page_params: Dict[str, Any]) -> List[Dict[str, Any]]:
+                return _read_list(self._get(self.base_url, params=page_params))
             
-        except requests.exceptions.RequestException as e:
-            raise WordPressAPIError(f"WordPress API request failed: {e}")
-        except ValueError as e:
-            raise WordPressAPIError(f"Invalid response from WordPress API: {e}")
+            with ThreadPoolExecutor(max_workers=min(8, len(more_pages))) as executor:
+                for page_content in executor.map(fetch_page, more_pages):
+                    content.extend(page_content)
+        
+        return content
     
-    def _filter_content_by_query(self, content: List[Dict[str, Any]], query: str) -> List[Dict[str, Any]]:
+    def get_content_by_id(self, content_id: int) -> Optional[ContentItem]:
         """
-        Return all content and let AI handle relevance filtering.
+        Retrieve specific content by ID.
         
         Args:
-            content: List of content items from API
-            query: Search query string (not used for filtering)
+            content_id: WordPress content ID
+        
+        Returns:
+            Content item or None if not found
+        """
+        cached, headers, stored = self._cached_item(content_id)
+        if cached is not None:
+            return cached
+        
+        try:
+            response = self._get(f"{self.base_url}/{content_id}", params=self._item_params, headers=headers)
+            return self._store_item(content_id, response, stored)
+        except (httpx.HTTPError, orjson.JSONDecodeError):
+            return None
+    
+    def get_content_by_ids(self, content_ids: Iterable[int], workers: int = 8) -> List[Optional[ContentItem]]:
+        """
+        Retrieve several content items concurrently.
+        
+        Requests share the session's connection pool and the rate limiter.
+        
+        Args:
+            content_ids: WordPress content IDs
+            workers: Maximum number of concurrent requests
+        
+        Returns:
+            Content items in the order of content_ids, None for any not found
+        """
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.get_content_by_id, content_ids))
+    
+    def test_connection(self) -> bool:
+        """
+        Test connection to WordPress API.
+        
+        A HEAD request is enough to check status and authentication. Servers
+        that reject HEAD get a GET for a single ID-only item instead.
+        
+        Returns:
+            True if connection successful, False otherwise
+        """
+        try:
+            self._rate_limit()
+            response = self.session.head(self.base_url)
+            if response.is_success:
+                return True
             
+            self._get(self.base_url, params=self._probe_params)
+            return True
+        except httpx.HTTPError:
+            return False
+
+
+class AsyncWordPressClient(_WordPressClientBase):
+    """
+    Asynchronous client for the WordPress REST API.
+    
+    Mirrors WordPressClient for callers running on an event loop, so
+    rate-limit waits and in-flight requests overlap without a thread each.
+    Close it with aclose() or use it as an async context manager.
+    """
+    
+    def __init__(self):
+        super().__init__()
+        
+        # One pooled client shared by all coroutines
+        self.session = httpx.AsyncClient(
+            # The Authorization header is precomputed, so no per-request auth flow
+            headers=config.get_wordpress_headers(),
+            timeout=config.request_timeout,
+            follow_redirects=True,
+            transport=httpx.AsyncHTTPTransport(
+                http2=h2 is not None,
+                retries=3,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=32)
+            )
+        )
+    
+    async def aclose(self):
+        """Close the underlying HTTP client."""
+        await self.session.aclose()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+    
+    async def _rate_limit(self):
+        """Take a token from the bucket, waiting for one to accumulate if it is empty."""
+        wait = self._reserve_token()
+        if wait:
+            await asyncio.sleep(wait)
+    
+    async def search_content(self, query: str, max_results: Optional[int] = None,
+                             include_content: bool = True) -> WordPressResults:
+        """
+        Search WordPress content using the provided API endpoint.
+        
+        Args:
+            query: Search query string
+            max_results: Maximum number of results to return
+            include_content: Fetch full post bodies; without them only excerpts are returned
+        
         Returns:
-            All content items for AI to analyze
+            Content items with metadata
         """
-        # Return all content and let the AI determine relevance
-        return [self._format_content_item(item) for item in content]
+        key = self._search_key(query, max_results, include_content)
+        cached = self._cached_search(key)
+        if cached is not None:
+            return cached
+        
+        try:
+            params = self._search_params(query, include_content)
+            
+            content = await self._get_content_list(params, key[1])
+            fallback = self._fallback_params(params, content)
+            if fallback is not None:
+                content = await self._get_content_list(fallback, key[1])
+        
+        except (httpx.HTTPError, ValueError) as e:
+            raise _api_error(e)
+        
+        return self._store_search(key, content)
     
-    def _format_content_item(self, item: Dict[str, Any]) -> Dict[str, Any]:
+    async def _get(self, url: str, params: Optional[Dict[str, Any]] = None,
+                   headers: Optional[Dict[str, str]] = None) -> httpx.Response:
         """
-        Format a WordPress content item for consistent output.
+        Send a rate-limited GET, retrying throttled and failed requests.
         
         Args:
-            item: Raw content item from WordPress API
+            url: Request URL
+            params: Query parameters
+            headers: Extra request headers
+        
+        Returns:
+            Successful response
+        
+        Raises:
+            httpx.HTTPError: If the request still fails after retrying
+        """
+        delay = RETRY_BASE_DELAY
+        for attempt in range(MAX_RETRIES + 1):
+            await self._rate_limit()
+            response = await self.session.get(url, params=params, headers=headers)
+            if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                break
             
+            wait, delay = _retry_wait(response, delay)
+            await asyncio.sleep(wait)
+        
+        return _check_status(response)
+    
+    async def _get_content_list(self, params: Dict[str, Any], max_results: int) -> List[Dict[str, Any]]:
+        """
+        Fetch content from the list endpoint, paginating past the page size cap.
+        
+        Args:
+            params: Query parameters
+            max_results: Maximum number of items wanted
+        
         Returns:
-            Formatted content item
+            Raw content items from the API, in page order
         """
-        # Handle the actual API response format
-        author_info = item.get('author', {})
-        if isinstance(author_info, dict):
-            author_name = author_info.get('name', 'Unknown')
-        else:
-            author_name = 'Unknown'
+        params = self._first_page_params(params, max_results)
+        response = await self._get(self.base_url, params=params)
+        content = _read_list(response)
+        
+        more_pages = self._more_page_params(response, params, max_results)
+        if more_pages:
+            async def fetch_page(page_params: Dict[str, Any]) -> List[Dict[str, Any]]:
+                return _read_list(await self._get(self.base_url, params=page_params))
             
-        return {
-            'id': item.get('id'),
-            'title': item.get('title', 'Untitled'),
-            'excerpt': item.get('excerpt', ''),
-            'content': item.get('content', ''),
-            'url': item.get('url', ''),
-            'date': item.get('date', ''),
-            'author': author_name,
-            'type': item.get('type', 'post'),
-            'slug': item.get('slug', '')
-        }
-    
-    def get_content_by_id(self, content_id: int) -> Optional[Dict[str, Any]]:
+            for page_content in await asyncio.gather(*map(fetch_page, more_pages)):
+                content.extend(page_content)
+        
+        return content
+    
+    async def get_content_by_id(self, content_id: int) -> Optional[ContentItem]:
         """
         Retrieve specific content by ID.
         
         Args:
             content_id: WordPress content ID
-            
+        
         Returns:
             Content item or None if not found
         """
-        self._rate_limit()
+        cached, headers, stored = self._cached_item(content_id)
+        if cached is not None:
+            return cached
         
         try:
-            response = self.session.get(
-                f"{self.base_url}/{content_id}",
-                timeout=config.request_timeout
-            )
-            response.raise_for_status()
-            
-            return self._format_content_item(response.json())
-            
-        except requests.exceptions.RequestException:
+            response = await self._get(f"{self.base_url}/{content_id}", params=self._item_params, headers=headers)
+            return self._store_item(content_id, response, stored)
+        except (httpx.HTTPError, orjson.JSONDecodeError):
             return None
     
-    def test_connection(self) -> bool:
+    async def get_content_by_ids(self, content_ids: Iterable[int]) -> List[Optional[ContentItem]]:
+        """
+        Retrieve several content items concurrently.
+        
+        Args:
+            content_ids: WordPress content IDs
+        
+        Returns:
+            Content items in the order of content_ids, None for any not found
+        """
+        return list(await asyncio.gather(*map(self.get_content_by_id, content_ids)))
+    
+    async def test_connection(self) -> bool:
         """
         Test connection to WordPress API.
         
@@ -147,18 +612,118 @@ class WordPressClient:
             True if connection successful, False otherwise
         """
         try:
-            self._rate_limit()
-            response = self.session.get(
-                self.base_url,
-                params={'per_page': 1},
-                timeout=config.request_timeout
-            )
-            response.raise_for_status()
+            await self._rate_limit()
+            response = await self.session.head(self.base_url)
+            if response.is_success:
+                return True
+            
+            await self._get(self.base_url, params=self._probe_params)
             return True
-        except requests.exceptions.RequestException:
+        except httpx.HTTPError:
             return False
 
 
+@functools.lru_cache(maxsize=1)
+def get_client() -> WordPressClient:
+    """
+    Return the process-wide WordPress client.
+    
+    Prefer this over constructing WordPressClient directly so every caller
+    shares one connection pool, rate limiter and cache.
+    
+    Returns:
+        Shared WordPressClient instance
+    """
+    return WordPressClient()
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header given in seconds or as an HTTP date.
+    
+    Args:
+        value: Header value
+        
+    Returns:
+        Seconds to wait, or None if the header is missing or invalid
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def _retry_wait(response: httpx.Response, delay: float) -> Tuple[float, float]:
+    """
+    Work out how long to wait before retrying a throttled or failed request.
+    
+    Args:
+        response: Response that will be retried
+        delay: Current backoff base delay
+        
+    Returns:
+        Seconds to wait and the backoff base delay for the next attempt
+    """
+    retry_after = _parse_retry_after(response.headers.get('Retry-After'))
+    if response.status_code == 429 and retry_after is not None:
+        wait = retry_after
+    else:
+        wait = random.uniform(delay, delay * 3)
+        delay *= 2
+    return min(wait, RETRY_MAX_DELAY), delay
+
+
+def _check_status(response: httpx.Response) -> httpx.Response:
+    """
+    Raise for an error response.
+    
+    Args:
+        response: Final response of a request
+    
+    Returns:
+        The response; 304 Not Modified is a valid answer to a conditional request
+    
+    Raises:
+        httpx.HTTPStatusError: If the response has a 4xx or 5xx status
+    """
+    if response.is_error:
+        response.raise_for_status()
+    return response
+
+
+def _read_list(response: httpx.Response) -> List[Dict[str, Any]]:
+    """
+    Decode a list endpoint response.
+    
+    Args:
+        response: List endpoint response
+        
+    Returns:
+        Raw content items
+        
+    Raises:
+        ValueError: If the body is not valid JSON or not a JSON array
+    """
+    content = orjson.loads(response.content)
+    if not isinstance(content, list):
+        raise ValueError(f"expected a list of items, got {type(content).__name__}")
+    return content
+
+
+def _api_error(error: Exception) -> 'WordPressAPIError':
+    """Convert a request or decoding failure into a WordPressAPIError."""
+    if isinstance(error, httpx.HTTPError):
+        return WordPressAPIError(f"WordPress API request failed: {error}")
+    return WordPressAPIError(f"Invalid response from WordPress API: {error}")
+
+
 class WordPressAPIError(Exception):
     """Exception raised for WordPress API errors."""
     pass